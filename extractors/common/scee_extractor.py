@@ -5,14 +5,281 @@ CRITICAL: Maintains exact field names for compatibility.
 """
 
 import re
-from typing import Dict, Any, List, Optional
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from typing import Dict, Any, List, Optional, NamedTuple, Tuple
 from decimal import Decimal
-from pathlib import Path
 
-# Import utilities
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from core.base_extractor import safe_decimal_conversion
+
+# Shared Decimal constants (immutable, safe to reuse in every result)
+_DECIMAL_ZERO = Decimal('0')
+_DECIMAL_CEM = Decimal('100')
+
+# Extraction trace on stdout (off by default: batch runs pay for every print)
+_DEBUG_SCEE = False
+
+# Public SCEE fields other than uc_geradora_N, in the order they are emitted
+_CAMPOS_SCEE = (
+    'geracao_ciclo', 'geracao_ugs_2',
+    'excedente_recebido', 'credito_recebido',
+    'saldo_p', 'saldo_fp', 'saldo_hr', 'saldo_hi', 'saldo',
+    'saldo_30_p', 'saldo_30_fp', 'saldo_30_hr', 'saldo_30_hi', 'saldo_30',
+    'saldo_60_p', 'saldo_60_fp', 'saldo_60_hr', 'saldo_60_hi', 'saldo_60',
+    'rateio_fatura', 'rateio_1', 'rateio_2', 'rateio_3',
+    'energia_injetada', 'valor_energia_injetada',
+)
+# uc_geradora_N field names, indexed by UG position
+# (uc_geradora_0 is written by _processar_dados_ugs when the first UG has zero geração)
+_CAMPOS_UC_GERADORA = ('uc_geradora_0', 'uc_geradora_1', 'uc_geradora_2', 'uc_geradora_3')
+# UCs emitted just before a field, when set by the writer of that field:
+# geração, rateio, then _processar_dados_ugs (ahead of energia_injetada)
+_UCS_ANTES_DE = {
+    'geracao_ciclo': ('uc_geradora_1',),
+    'geracao_ugs_2': ('uc_geradora_2',),
+    'rateio_1': ('uc_geradora_1',),
+    'rateio_2': ('uc_geradora_2',),
+    'rateio_3': ('uc_geradora_3',),
+    'energia_injetada': _CAMPOS_UC_GERADORA,
+}
+
+
+class _RegistroUG(NamedTuple):
+    """Geração/excedente of one generating UC."""
+    uc: str
+    tipo: str
+    total: Decimal
+
+
+def _normalizar_br(valor: str) -> str:
+    r"""
+    Normalise a [\d.,]+ capture to a dot-decimal string, with the same
+    separator rules as safe_decimal_conversion. The result may be empty
+    or keep several dots; callers treat both as zero.
+    """
+    if ',' in valor:
+        valor = valor.replace('.', '').replace(',', '.') if '.' in valor else valor.replace(',', '.')
+    return valor.rstrip('.')
+
+
+def _valor_br_inteiro(valor: str) -> Tuple[int, int]:
+    r"""
+    Parse a [\d.,]+ capture into (coefficient, decimal places).
+    Decimal(coef).scaleb(-casas) equals _decimal_br(valor), exponent included.
+    """
+    valor = _normalizar_br(valor)
+    inteiro, _, fracao = valor.partition('.')
+    if not valor or '.' in fracao:
+        return 0, 0
+    return int(inteiro + fracao), len(fracao)
+
+
+def _decimal_br(valor: str) -> Decimal:
+    r"""
+    Decimal of a [\d.,]+ capture. Same result as safe_decimal_conversion
+    (exponent included) without its generic cleaning of arbitrary input.
+    """
+    valor = _normalizar_br(valor)
+    if not valor or valor.count('.') > 1:
+        return _DECIMAL_ZERO
+    return Decimal(valor)
+
+
+def _somar_valores_br(*valores: str) -> Decimal:
+    """Exact sum of Brazilian-formatted captures in integer fixed point, one Decimal at the end."""
+    parcelas = [_valor_br_inteiro(valor) for valor in valores]
+    casas = max(c for _, c in parcelas)
+    total = sum(coef * 10 ** (casas - c) for coef, c in parcelas)
+    return Decimal(total).scaleb(-casas)
+
+
+def _primeiro_saldo(padrao: 're.Pattern[str]', texto: str, pos: int) -> 'Optional[re.Match[str]]':
+    """
+    First BRANCA match of a combined saldo pattern, else the first
+    convencional one (a BRANCA row anywhere in the text takes priority).
+    """
+    convencional = None
+    for match in padrao.finditer(texto, pos):
+        if match.group(1) is not None:
+            return match
+        if convencional is None:
+            convencional = match
+    return convencional
+
+
+# Result for invoices without SCEE (copied by _default_scee_values)
+_DEFAULT_SCEE = {
+    # Saldos principais
+    'saldo': _DECIMAL_ZERO,
+    'saldo_30': _DECIMAL_ZERO,
+    'saldo_60': _DECIMAL_ZERO,
+
+    # Energias
+    'excedente_recebido': _DECIMAL_ZERO,
+    'credito_recebido': _DECIMAL_ZERO,
+    'energia_injetada': _DECIMAL_ZERO,  # CRITICAL para Calculadora_AUPUS
+    'geracao_ciclo': _DECIMAL_ZERO,
+
+    # UCs geradoras
+    'uc_geradora_1': '',
+    'uc_geradora_2': '',
+    'uc_geradora_3': '',
+
+    # Rateios
+    'rateio_1': _DECIMAL_ZERO,
+    'rateio_2': _DECIMAL_ZERO,
+    'rateio_3': _DECIMAL_ZERO
+}
+
+# Markers that identify an invoice with SCEE information
+_INDICADORES_SCEE = (
+    "INFORMAÇÕES DO SCEE:", "INFORMACOES DO SCEE:",
+    "CRÉDITO DE ENERGIA:", "CREDITO DE ENERGIA:", "SCEE:",
+    "EXCEDENTE RECEBIDO", "GERAÇÃO CICLO", "GERACAO CICLO",
+    "SALDO KWH", "CRÉDITO RECEBIDO", "CREDITO RECEBIDO",
+    "ENERGIA INJETADA", "SISTEMA DE COMPENSAÇÃO"
+)
+
+# Rows that close the INJEÇÃO block in the line-by-line fallback
+_FIM_BLOCO_INJECAO = ('CONTRIB', 'ITENS', 'TOTAL')
+
+# Compiled SCEE patterns. All literals are upper-case: they are matched
+# case-sensitively against the upper-cased invoice text.
+_RE_GERACAO = (
+    re.compile(r'GERA[ÇC][ÃA]O CICLO[^\n]{0,80}?KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)'),
+    re.compile(r'GERA[ÇC][ÃA]O CICLO[^\n]{0,80}?UC\s*(\d+)[^\n:]{0,40}:\s*([\d.,]+)'),
+)
+# "UC 10037114024 : P=0,40, FP=18.781,95, HR=0,00, HI=0,00"
+_RE_GERACAO_BRANCA = re.compile(r'UC\s*(\d+)\s*:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)')
+
+_RE_EXCEDENTE = (
+    re.compile(r'EXCEDENTE RECEBIDO KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)'),
+    re.compile(r'EXCEDENTE RECEBIDO[^\n]{0,80}?UC\s*(\d+)[^\n:]{0,40}:\s*([\d.,]+)'),
+    re.compile(r'ENERGIA EXCEDENTE[^\n]{0,80}?UC\s*(\d+)[^\n:]{0,40}:\s*([\d.,]+)'),
+)
+# "EXCEDENTE RECEBIDO KWH: UC 10037114024 : P=0,11, FP=5.258,95, HR=0,00, HI=0,00"
+_RE_EXCEDENTE_BRANCA = re.compile(r'EXCEDENTE RECEBIDO KWH:\s*UC\s*(\d+)\s*:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)')
+
+_RE_CREDITO = (
+    re.compile(r'CR[ÉE]DITO RECEBIDO KWH\s+([\d.,]+)'),
+    re.compile(r'CR[ÉE]DITO RECEBIDO[^\n]{0,40}?([\d.,]+)'),
+    re.compile(r'CR[ÉE]DITO DE ENERGIA[^\n]{0,40}?([\d.,]+)'),
+)
+
+# Saldo rows come as BRANCA ("SALDO KWH: P=1.234,56, FP=5.678,90, HR=0,00,
+# HI=0,00", groups 1-4) or convencional ("SALDO KWH: 5.128,26", group 5):
+# one pattern covers both, the *_CONV tuples are the looser fallbacks
+_RE_SALDO = re.compile(r'SALDO KWH:\s*(?:P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)|([\d.,]+)(?=,|\s|$))')
+_RE_SALDO_CONV = (
+    re.compile(r'SALDO DO CICLO[^\n]{0,80}?KWH[^\n]{0,40}?([\d.,]+)'),
+    re.compile(r'SALDO[^\n]{0,40}?([\d.,]+)\s*KWH'),
+)
+
+_RE_SALDO_30 = re.compile(r'SALDO A EXPIRAR EM 30 DIAS KWH:\s*(?:P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)|([\d.,]+)(?=,|\s|$))')
+_RE_SALDO_30_CONV = (
+    re.compile(r'A EXPIRAR EM 30 DIAS[^\n]{0,40}?([\d.,]+)'),
+    re.compile(r'EXPIRAR[^\n]{0,40}?30[^\n]{0,40}?DIAS[^\n]{0,40}?([\d.,]+)'),
+)
+_RE_SALDO_60 = re.compile(r'SALDO A EXPIRAR EM 60 DIAS KWH:\s*(?:P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)|([\d.,]+)(?=,|\s|$))')
+_RE_SALDO_60_CONV = (
+    re.compile(r'A EXPIRAR EM 60 DIAS[^\n]{0,40}?([\d.,]+)'),
+    re.compile(r'EXPIRAR[^\n]{0,40}?60[^\n]{0,40}?DIAS[^\n]{0,40}?([\d.,]+)'),
+)
+
+# "CADASTRO RATEIO GERAÇÃO: UC 12345 = 100%"
+_RE_RATEIO = re.compile(r'CADASTRO RATEIO GERAÇÃO:\s*UC\s*(\d+)\s*=\s*([\d.,]+%?)')
+# "RATEIO DA GERAÇÃO: UC 10037114075 (45%), UC 10037114024 (55%)"
+_RE_RATEIO_MULTIPLO = re.compile(r'RATEIO[^\n]{0,80}?UC\s*(\d+)[^\n]{0,40}?([\d,]+)%')
+
+# "INJEÇÃO SCEE - UC 10037100562 - GD I kWh 709,00 0,643844 -456,49"
+_RE_INJECAO_COMPLETA = re.compile(r'INJE[ÇC][ÃA]O SCEE[^\n]{0,80}?KWH\s+([\d.,]+)\s+([\d.,]+)\s+([-]?[\d.,]+)')
+_RE_INJECAO_EXTERNA = re.compile(r'INJE[ÇC][ÃA]O SCEE[^\n]{0,80}?KWH\s+([\d.,]+)\s+([\d.,]+)\s+([-]?[\d.,]+)\s+([-]?[\d.,]+)')
+_RE_UC = re.compile(r'UC\s*(\d+)')
+
+# Section anchors and their literal spellings. Every SCEE pattern starts at
+# one of these anchors or a fixed number of characters before it, so
+# searching from the first anchor offset gives the same match as searching
+# from 0. Plain str.find per literal: no scan at all for absent sections.
+_SECOES_SCEE = (
+    ('ciclo', ('CICLO',)),
+    ('credito', ('CRÉDITO', 'CREDITO')),
+    ('excedente', ('EXCEDENTE',)),
+    ('expirar', ('EXPIRAR',)),
+    ('saldo', ('SALDO',)),
+    ('rateio', ('RATEIO',)),
+    ('injecao', ('INJEÇÃO SCEE', 'INJECÃO SCEE', 'INJEÇAO SCEE', 'INJECAO SCEE')),
+    ('uc', ('UC',)),
+    ('hi', ('HI=',)),
+)
+
+# Signed Brazilian-formatted number in the INJEÇÃO table rows
+_NUMERO_INJECAO_RE = re.compile(r'-?[\d.,]+')
+
+_NAO_DEFINIDO = object()  # marker for "slot never assigned"
+
+# Results of previous extractions keyed by text digest (LRU, bounded).
+# Shared by every extractor instance: reads and writes hold the lock
+_CACHE_SCEE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_CACHE_SCEE_MAX = 4096
+_CACHE_SCEE_LOCK = threading.Lock()
+
+
+class _SceeAcumulador:
+    """
+    Single per-invoice record written by every _extrair_* helper.
+    Slots left unassigned are simply not emitted by as_dict().
+    """
+
+    __slots__ = _CAMPOS_SCEE + _CAMPOS_UC_GERADORA + ('_geracao_ugs_raw', '_excedente_ugs_raw')
+
+    def __contains__(self, campo: str) -> bool:
+        return hasattr(self, campo)
+
+    def get(self, campo: str, padrao: Any = None) -> Any:
+        return getattr(self, campo, padrao)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Output dict in the key order the helpers' partial dicts used to
+        produce: each uc_geradora_N sits where its first writer put it, and
+        the empty UCs filled by _processar_dados_ugs follow energia_injetada.
+        """
+        ucs = {campo: valor for campo in _CAMPOS_UC_GERADORA
+               if (valor := getattr(self, campo, _NAO_DEFINIDO)) is not _NAO_DEFINIDO}
+        dados = {}
+        for campo in _CAMPOS_SCEE:
+            valor = getattr(self, campo, _NAO_DEFINIDO)
+            if valor is _NAO_DEFINIDO:
+                continue
+            for uc in _UCS_ANTES_DE.get(campo, ()):
+                if ucs.get(uc):
+                    dados[uc] = ucs.pop(uc)
+            dados[campo] = valor
+            if campo == 'energia_injetada':
+                dados.update(ucs)
+                ucs.clear()
+        dados.update(ucs)
+        return dados
+
+
+# Posto fields (P, FP, HR, HI) and total written for each BRANCA saldo
+_CAMPOS_SALDO = ('saldo_p', 'saldo_fp', 'saldo_hr', 'saldo_hi', 'saldo')
+_CAMPOS_SALDO_30 = ('saldo_30_p', 'saldo_30_fp', 'saldo_30_hr', 'saldo_30_hi', 'saldo_30')
+_CAMPOS_SALDO_60 = ('saldo_60_p', 'saldo_60_fp', 'saldo_60_hr', 'saldo_60_hi', 'saldo_60')
+
+
+def _gravar_postos(acc: _SceeAcumulador, campos: Tuple[str, ...], match: 're.Match[str]') -> Tuple[Decimal, ...]:
+    """
+    Store a BRANCA match (groups 1-4 = P, FP, HR, HI) in campos[:4] and
+    their sum in campos[4]. Returns the four posto values.
+    """
+    postos = tuple(map(_decimal_br, match.group(1, 2, 3, 4)))
+    for campo, valor in zip(campos, postos):
+        setattr(acc, campo, valor)
+    setattr(acc, campos[4], postos[0] + postos[1] + postos[2] + postos[3])
+    return postos
 
 
 class SCEEExtractor:
@@ -29,7 +296,30 @@ class SCEEExtractor:
     """
 
     def __init__(self):
-        self.debug = True
+        self.debug = _DEBUG_SCEE
+
+    @classmethod
+    def extract_many(cls, textos: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract SCEE data from several invoice texts in parallel processes.
+
+        Workers are started with spawn on Windows, which re-imports the
+        calling script: call this only under an `if __name__ == '__main__':`
+        guard there, or the workers fail at startup.
+
+        Args:
+            textos: Full texts of the invoices
+            max_workers: Process count (defaults to the CPU count)
+
+        Returns:
+            One SCEE dict per text, in input order (debug output disabled)
+        """
+        textos = list(textos)
+        if len(textos) < 2:
+            return [_extrair_scee_sem_debug(texto) for texto in textos]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_extrair_scee_sem_debug, textos, chunksize=8))
 
     def extract_scee_data(self, texto_completo: str) -> Dict[str, Any]:
         """
@@ -41,6 +331,35 @@ class SCEEExtractor:
         Returns:
             Dictionary with SCEE data using exact field names
         """
+        # Debug runs always extract: a cached result would skip the trace
+        if self.debug:
+            return self._extrair_dados_scee(texto_completo)
+
+        # Re-processed invoices yield the same text: reuse the previous result.
+        # surrogatepass keeps texts that differ only in lone surrogates apart
+        try:
+            chave = blake2b(texto_completo.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        except Exception:
+            return self._default_scee_values()
+
+        with _CACHE_SCEE_LOCK:
+            dados_cache = _CACHE_SCEE.get(chave)
+            if dados_cache is not None:
+                _CACHE_SCEE.move_to_end(chave)
+        if dados_cache is not None:
+            return dict(dados_cache)  # values are immutable, a shallow copy is enough
+
+        dados = self._extrair_dados_scee(texto_completo)
+
+        with _CACHE_SCEE_LOCK:
+            _CACHE_SCEE[chave] = dict(dados)
+            if len(_CACHE_SCEE) > _CACHE_SCEE_MAX:
+                _CACHE_SCEE.popitem(last=False)
+
+        return dados
+
+    def _extrair_dados_scee(self, texto_completo: str) -> Dict[str, Any]:
+        """Run the full SCEE extraction (no cache)."""
         dados = {}
 
         try:
@@ -51,70 +370,69 @@ class SCEEExtractor:
                 print(f"{'='*60}")
                 print(f"Texto total: {len(texto_completo)} caracteres")
 
+            # Upper-case once: the SCEE markers and every pattern below are
+            # upper-case literals matched case-sensitively against this copy
+            texto_upper = texto_completo.upper()
+
             # Check if this invoice has SCEE information
-            if not self._tem_informacoes_scee(texto_completo):
+            if not self._tem_informacoes_scee(texto_upper):
                 if self.debug:
                     print("Nenhuma informacao SCEE encontrada.")
                 return self._default_scee_values()
 
-            # Debug: Show SCEE block if found
-            if "INFORMAÇÕES DO SCEE" in texto_completo or "INFORMACOES DO SCEE" in texto_completo:
+            if self.debug:
+                # Show SCEE block if found
                 inicio = texto_completo.find("INFORMAÇÕES DO SCEE")
                 if inicio == -1:
                     inicio = texto_completo.find("INFORMACOES DO SCEE")
 
                 if inicio != -1:
-                    bloco = texto_completo[inicio:inicio+500]
-                    if self.debug:
-                        print(f"\nBLOCO SCEE ENCONTRADO:")
-                        print(bloco)
-                        print()
-                else:
-                    if self.debug:
-                        print("Bloco INFORMACOES DO SCEE nao encontrado!")
+                    print(f"\nBLOCO SCEE ENCONTRADO:")
+                    print(texto_completo[inicio:inicio+500])
+                    print()
 
-            # Check for INJECAO SCEE line in table
-            if self.debug:
-                linhas = texto_completo.split('\n')
-                for linha in linhas:
+                # Check for INJECAO SCEE line in table
+                for linha in texto_completo.split('\n'):
                     if "INJEÇÃO SCEE" in linha or "INJECAO SCEE" in linha:
                         print(f"Linha INJECAO encontrada: {linha}")
                         break
 
+            # All helpers write straight into one accumulator
+            acc = _SceeAcumulador()
+
+            # First offset of every section
+            inicio = self._localizar_secoes(texto_upper)
+
             # Extract generation data
-            geracao_data = self._extrair_geracao_ciclo(texto_completo)
-            dados.update(geracao_data)
+            self._extrair_geracao_ciclo(texto_upper, acc, inicio)
 
             # Extract excedente data
-            excedente_data = self._extrair_excedente_recebido(texto_completo)
-            dados.update(excedente_data)
+            self._extrair_excedente_recebido(texto_upper, acc, inicio)
 
             # Extract credit data
-            credito_data = self._extrair_credito_recebido(texto_completo)
-            dados.update(credito_data)
+            self._extrair_credito_recebido(texto_upper, acc, inicio)
 
             # Extract saldo data
-            saldo_data = self._extrair_saldo_energia(texto_completo)
-            dados.update(saldo_data)
+            self._extrair_saldo_energia(texto_upper, acc, inicio)
 
             # Extract saldos a expirar
-            saldos_expirar = self._extrair_saldos_a_expirar(texto_completo)
-            dados.update(saldos_expirar)
+            self._extrair_saldos_a_expirar(texto_upper, acc, inicio)
 
             # Extract rateio data
-            rateio_data = self._extrair_rateio_geracao(texto_completo)
-            dados.update(rateio_data)
+            self._extrair_rateio_geracao(texto_upper, acc, inicio)
 
             # Process UG data and set energia_injetada
-            self._processar_dados_ugs(dados)
+            self._processar_dados_ugs(acc)
 
             # Extract injection data from table (INJECAO SCEE line)
-            injecao_data = self._extrair_injecao_scee(texto_completo)
-            dados.update(injecao_data)
+            self._extrair_injecao_scee(texto_completo, texto_upper, acc, inicio)
 
             # Try to get injection data from external source (B extractor results) if available
             # This addresses cases where the line reconstruction didn't capture the right values
-            self._tentar_injecao_externa(dados, texto_completo)
+            self._tentar_injecao_externa(acc, texto_upper, inicio)
+
+            # Build the output dict once, from the fields actually set
+            dados = acc.as_dict()
 
             # Print final debug summary
             if self.debug:
@@ -130,79 +448,67 @@ class SCEEExtractor:
 
         return dados
 
-    def _tem_informacoes_scee(self, texto: str) -> bool:
-        """Check if invoice contains SCEE information."""
-        scee_indicators = [
-            "INFORMAÇÕES DO SCEE:", "INFORMACOES DO SCEE:",
-            "CRÉDITO DE ENERGIA:", "CREDITO DE ENERGIA:", "SCEE:",
-            "EXCEDENTE RECEBIDO", "GERAÇÃO CICLO", "GERACAO CICLO",
-            "SALDO KWH", "CRÉDITO RECEBIDO", "CREDITO RECEBIDO",
-            "ENERGIA INJETADA", "SISTEMA DE COMPENSAÇÃO"
-        ]
+    def _tem_informacoes_scee(self, texto_upper: str) -> bool:
+        """Check if the upper-cased invoice text contains SCEE information."""
+        # Plain substring search (C fast-search) beats a case-insensitive
+        # alternation, which re-folds every character for every marker
+        return any(indicador in texto_upper for indicador in _INDICADORES_SCEE)
 
-        return any(indicator in texto.upper() for indicator in scee_indicators)
-
-    def _extrair_geracao_ciclo(self, texto: str) -> Dict[str, Any]:
+    def _localizar_secoes(self, texto_upper: str) -> Dict[str, int]:
+        """
+        Return the first offset of each section anchor found in the text.
+        Sections that are absent have no key, so their patterns are skipped.
+        """
+        inicio = {}
+        for secao, literais in _SECOES_SCEE:
+            posicoes = [pos for pos in map(texto_upper.find, literais) if pos != -1]
+            if posicoes:
+                inicio[secao] = min(posicoes)
+        return inicio
+
+    def _extrair_geracao_ciclo(self, texto: str, acc: _SceeAcumulador, inicio: Dict[str, int]):
         """Extract geração ciclo data."""
-        resultado = {}
         geracao_matches = []
 
         if self.debug:
             print(f"[SCEE] Extraindo geração ciclo...")
 
         # PADRÕES MÚLTIPLOS para maior robustez - formato brasileiro
-        geracao_patterns = [
-            r'GERAÇÃO CICLO.*?KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)',
-            r'GERACAO CICLO.*?KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)',
-            r'GERAÇÃO CICLO.*?UC\s*(\d+).*?:\s*([\d.,]+)',
-            r'GERACAO CICLO.*?UC\s*(\d+).*?:\s*([\d.,]+)'
-        ]
-
         geracao_match = None
-        for pattern in geracao_patterns:
-            geracao_match = re.search(pattern, texto, re.IGNORECASE)
-            if geracao_match:
-                if self.debug:
-                    print(f"   Padrão geração encontrado: {pattern}")
-                    print(f"   Match: {geracao_match.group(0)}")
-                break
+        if 'ciclo' in inicio:
+            pos = max(inicio['ciclo'] - len('GERAÇÃO '), 0)
+            for pattern in _RE_GERACAO:
+                geracao_match = pattern.search(texto, pos)
+                if geracao_match:
+                    if self.debug:
+                        print(f"   Padrão geração encontrado: {pattern.pattern}")
+                        print(f"   Match: {geracao_match.group(0)}")
+                    break
 
+        # UC numbers repeat across an installation's invoices: share one str each
         if geracao_match:
-            uc_geradora = geracao_match.group(1)
+            uc_geradora = sys.intern(geracao_match.group(1))
             geracao_valor_str = geracao_match.group(2)
             geracao_total = self._converter_valor_brasileiro(geracao_valor_str)
 
-            geracao_matches.append({
-                'uc': uc_geradora,
-                'tipo': 'grupo_b',
-                'total': geracao_total
-            })
+            geracao_matches.append(_RegistroUG(uc_geradora, 'grupo_b', geracao_total))
 
             if self.debug:
                 print(f"   OK: Geração detectada: UC {uc_geradora}, Total: {geracao_total}")
 
-        # PADRÃO TARIFA BRANCA: "UC 10037114024 : P=0,40, FP=18.781,95, HR=0,00, HI=0,00"
-        geracao_branca_pattern = r'UC\s*(\d+)\s*:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)'
-        geracao_branca_match = re.search(geracao_branca_pattern, texto, re.IGNORECASE)
+        # PADRÃO TARIFA BRANCA
+        geracao_branca_match = None
+        if 'hi' in inicio and 'uc' in inicio:
+            geracao_branca_match = _RE_GERACAO_BRANCA.search(texto, inicio['uc'])
 
         if geracao_branca_match:
-            uc_geradora = geracao_branca_match.group(1)
-            p_val = safe_decimal_conversion(geracao_branca_match.group(2))
-            fp_val = safe_decimal_conversion(geracao_branca_match.group(3))
-            hr_val = safe_decimal_conversion(geracao_branca_match.group(4))
-            hi_val = safe_decimal_conversion(geracao_branca_match.group(5))
-
-            geracao_total = p_val + fp_val + hr_val + hi_val
-
-            geracao_matches.append({
-                'uc': uc_geradora,
-                'tipo': 'grupo_b_branca',
-                'total': geracao_total,
-                'p': p_val,
-                'fp': fp_val,
-                'hr': hr_val,
-                'hi': hi_val
-            })
+            uc_geradora = sys.intern(geracao_branca_match.group(1))
+            p_val, fp_val, hr_val, hi_val = geracao_branca_match.group(2, 3, 4, 5)
+
+            # Postos are summed in integer fixed point; only the total becomes a Decimal
+            geracao_total = _somar_valores_br(p_val, fp_val, hr_val, hi_val)
+
+            geracao_matches.append(_RegistroUG(uc_geradora, 'grupo_b_branca', geracao_total))
 
             if self.debug:
                 print(f"   OK: Geração Branca: UC {uc_geradora}, Total: {geracao_total}")
@@ -210,79 +516,60 @@ class SCEEExtractor:
 
         # Store generation data
         if geracao_matches:
-            resultado['_geracao_ugs_raw'] = geracao_matches
+            acc._geracao_ugs_raw = geracao_matches
 
             # Set first UG as primary
-            resultado['uc_geradora_1'] = geracao_matches[0]['uc']
-            resultado['geracao_ciclo'] = geracao_matches[0]['total']
+            acc.uc_geradora_1 = geracao_matches[0].uc
+            acc.geracao_ciclo = geracao_matches[0].total
 
             # Set second UG if available
             if len(geracao_matches) > 1:
-                resultado['uc_geradora_2'] = geracao_matches[1]['uc']
-                resultado['geracao_ugs_2'] = geracao_matches[1]['total']
-
-        return resultado
+                acc.uc_geradora_2 = geracao_matches[1].uc
+                acc.geracao_ugs_2 = geracao_matches[1].total
 
-    def _extrair_excedente_recebido(self, texto: str) -> Dict[str, Any]:
+    def _extrair_excedente_recebido(self, texto: str, acc: _SceeAcumulador, inicio: Dict[str, int]):
         """Extract excedente recebido data."""
-        resultado = {}
         excedente_matches = []
 
         if self.debug:
             print(f"[SCEE] Extraindo excedente recebido...")
 
-        # PADRÕES MÚLTIPLOS para maior robustez - formato brasileiro
-        excedente_patterns = [
-            r'EXCEDENTE RECEBIDO KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)',
-            r'EXCEDENTE RECEBIDO.*?UC\s*(\d+).*?:\s*([\d.,]+)',
-            r'ENERGIA EXCEDENTE.*?UC\s*(\d+).*?:\s*([\d.,]+)'
-        ]
+        if 'excedente' not in inicio:
+            acc.excedente_recebido = _DECIMAL_ZERO
+            return
+        pos = max(inicio['excedente'] - len('ENERGIA '), 0)
 
+        # PADRÕES MÚLTIPLOS para maior robustez - formato brasileiro
         excedente_match = None
-        for pattern in excedente_patterns:
-            excedente_match = re.search(pattern, texto, re.IGNORECASE)
+        for pattern in _RE_EXCEDENTE:
+            excedente_match = pattern.search(texto, pos)
             if excedente_match:
                 if self.debug:
-                    print(f"   Padrão excedente encontrado: {pattern}")
+                    print(f"   Padrão excedente encontrado: {pattern.pattern}")
                     print(f"   Match: {excedente_match.group(0)}")
                 break
 
         if excedente_match:
-            uc = excedente_match.group(1)
+            uc = sys.intern(excedente_match.group(1))
             excedente_valor_str = excedente_match.group(2)
             excedente_total = self._converter_valor_brasileiro(excedente_valor_str)
 
-            excedente_matches.append({
-                'uc': uc,
-                'tipo': 'grupo_b',
-                'total': excedente_total
-            })
+            excedente_matches.append(_RegistroUG(uc, 'grupo_b', excedente_total))
 
             if self.debug:
                 print(f"   OK: Excedente detectado: UC {uc}, Total: {excedente_total}")
 
-        # PADRÃO TARIFA BRANCA: "EXCEDENTE RECEBIDO KWH: UC 10037114024 : P=0,11, FP=5.258,95, HR=0,00, HI=0,00"
-        excedente_branca_pattern = r'EXCEDENTE RECEBIDO KWH:\s*UC\s*(\d+)\s*:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)'
-        excedente_branca_match = re.search(excedente_branca_pattern, texto, re.IGNORECASE)
+        # PADRÃO TARIFA BRANCA
+        excedente_branca_match = _RE_EXCEDENTE_BRANCA.search(texto, pos)
 
         if excedente_branca_match:
-            uc = excedente_branca_match.group(1)
-            p_val = safe_decimal_conversion(excedente_branca_match.group(2))
-            fp_val = safe_decimal_conversion(excedente_branca_match.group(3))
-            hr_val = safe_decimal_conversion(excedente_branca_match.group(4))
-            hi_val = safe_decimal_conversion(excedente_branca_match.group(5))
-
-            excedente_total = p_val + fp_val + hr_val + hi_val
-
-            excedente_matches.append({
-                'uc': uc,
-                'tipo': 'grupo_b_branca',
-                'total': excedente_total,
-                'p': p_val,
-                'fp': fp_val,
-                'hr': hr_val,
-                'hi': hi_val
-            })
+            uc = sys.intern(excedente_branca_match.group(1))
+            p_val, fp_val, hr_val, hi_val = excedente_branca_match.group(2, 3, 4, 5)
+
+            # Postos are summed in integer fixed point; only the total becomes a Decimal
+            excedente_total = _somar_valores_br(p_val, fp_val, hr_val, hi_val)
+
+            excedente_matches.append(_RegistroUG(uc, 'grupo_b_branca', excedente_total))
 
             if self.debug:
                 print(f"   OK: Excedente Branca: UC {uc}, Total: {excedente_total}")
@@ -290,236 +577,201 @@ class SCEEExtractor:
 
         # Store excedente data
         if excedente_matches:
-            resultado['_excedente_ugs_raw'] = excedente_matches
+            acc._excedente_ugs_raw = excedente_matches
 
-            # Calculate total excedente
-            total_excedente = sum(item['total'] for item in excedente_matches)
-            resultado['excedente_recebido'] = total_excedente
+            # Calculate total excedente (at most one convencional + one branca record)
+            total_excedente = excedente_matches[0].total
+            if len(excedente_matches) > 1:
+                total_excedente += excedente_matches[1].total
+            acc.excedente_recebido = total_excedente
         else:
-            resultado['excedente_recebido'] = Decimal('0')
-
-        return resultado
+            acc.excedente_recebido = _DECIMAL_ZERO
 
-    def _extrair_credito_recebido(self, texto: str) -> Dict[str, Any]:
+    def _extrair_credito_recebido(self, texto: str, acc: _SceeAcumulador, inicio: Dict[str, int]):
         """Extract crédito recebido data."""
-        resultado = {}
 
         if self.debug:
             print(f"[SCEE] Extraindo crédito recebido...")
 
+        if 'credito' not in inicio:
+            acc.credito_recebido = _DECIMAL_ZERO
+            return
+        pos = inicio['credito']
+
         # MÚLTIPLOS PADRÕES para maior robustez - formato brasileiro
-        credito_patterns = [
-            r'CRÉDITO RECEBIDO KWH\s+([\d.,]+)',
-            r'CREDITO RECEBIDO KWH\s+([\d.,]+)',
-            r'CRÉDITO RECEBIDO.*?([\d.,]+)',
-            r'CREDITO RECEBIDO.*?([\d.,]+)',
-            r'CRÉDITO DE ENERGIA.*?([\d.,]+)',
-            r'CREDITO DE ENERGIA.*?([\d.,]+)'
-        ]
-
-        for pattern in credito_patterns:
-            match = re.search(pattern, texto, re.IGNORECASE)
+        for pattern in _RE_CREDITO:
+            match = pattern.search(texto, pos)
             if match:
                 credito_valor_str = match.group(1)
                 valor_credito = self._converter_valor_brasileiro(credito_valor_str)
-                resultado['credito_recebido'] = valor_credito
+                acc.credito_recebido = valor_credito
 
                 if self.debug:
                     print(f"   OK: Crédito detectado: {valor_credito} (string: {credito_valor_str})")
                 break
 
-        if 'credito_recebido' not in resultado:
-            resultado['credito_recebido'] = Decimal('0')
+        if 'credito_recebido' not in acc:
+            acc.credito_recebido = _DECIMAL_ZERO
 
-        return resultado
-
-    def _extrair_saldo_energia(self, texto: str) -> Dict[str, Any]:
+    def _extrair_saldo_energia(self, texto: str, acc: _SceeAcumulador, inicio: Dict[str, int]):
         """Extract saldo energia data."""
-        resultado = {}
 
         if self.debug:
             print(f"[SCEE] Extraindo saldo energia...")
 
-        # PADRÃO TARIFA BRANCA: "SALDO KWH: P=1.234,56, FP=5.678,90, HR=0,00, HI=0,00"
-        saldo_branca_pattern = r'SALDO KWH:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)'
-        saldo_branca_match = re.search(saldo_branca_pattern, texto, re.IGNORECASE)
-
-        if saldo_branca_match:
-            # TARIFA BRANCA - saldos separados por posto
-            saldo_p = safe_decimal_conversion(saldo_branca_match.group(1))
-            saldo_fp = safe_decimal_conversion(saldo_branca_match.group(2))
-            saldo_hr = safe_decimal_conversion(saldo_branca_match.group(3))
-            saldo_hi = safe_decimal_conversion(saldo_branca_match.group(4))
+        if 'saldo' not in inicio:
+            acc.saldo = _DECIMAL_ZERO
+            if self.debug:
+                print(f"   Saldo definido como 0 (não encontrado)")
+            return
+        pos = inicio['saldo']
 
-            saldo_total = saldo_p + saldo_fp + saldo_hr + saldo_hi
+        # PADRÃO TARIFA BRANCA ou CONVENCIONAL (uma única varredura)
+        saldo_match = _primeiro_saldo(_RE_SALDO, texto, pos)
 
-            # Save saldos por posto
-            resultado['saldo_p'] = saldo_p
-            resultado['saldo_fp'] = saldo_fp
-            resultado['saldo_hr'] = saldo_hr
-            resultado['saldo_hi'] = saldo_hi
-            resultado['saldo'] = saldo_total
+        if saldo_match is not None and saldo_match.group(1) is not None:
+            # TARIFA BRANCA - saldos separados por posto
+            saldo_p, saldo_fp, saldo_hr, saldo_hi = _gravar_postos(acc, _CAMPOS_SALDO, saldo_match)
+            saldo_total = acc.saldo
 
             if self.debug:
                 print(f"   OK: Saldo Branca detectado:")
                 print(f"       P={saldo_p}, FP={saldo_fp}, HR={saldo_hr}, HI={saldo_hi}")
                 print(f"       Total: {saldo_total}")
+        elif saldo_match is not None:
+            saldo_valor_str = saldo_match.group(5)
+            saldo_total = self._converter_valor_brasileiro(saldo_valor_str)
+            acc.saldo = saldo_total
+
+            if self.debug:
+                print(f"   OK: Saldo Convencional detectado: {saldo_total} (string: {saldo_valor_str})")
         else:
             # PADRÕES CONVENCIONAL MÚLTIPLOS - formato brasileiro
-            saldo_conv_patterns = [
-                r'SALDO KWH:\s*([\d.,]+)(?=,|\s|$)',
-                r'SALDO DO CICLO.*?KWH.*?([\d.,]+)',
-                r'SALDO.*?([\d.,]+)\s*KWH'
-            ]
-
-            for pattern in saldo_conv_patterns:
-                saldo_conv_match = re.search(pattern, texto, re.IGNORECASE)
+            for pattern in _RE_SALDO_CONV:
+                saldo_conv_match = pattern.search(texto, pos)
                 if saldo_conv_match:
                     saldo_valor_str = saldo_conv_match.group(1)
                     saldo_total = self._converter_valor_brasileiro(saldo_valor_str)
-                    resultado['saldo'] = saldo_total
+                    acc.saldo = saldo_total
 
                     if self.debug:
                         print(f"   OK: Saldo Convencional detectado: {saldo_total} (string: {saldo_valor_str})")
                     break
 
         # Default saldo if not found
-        if 'saldo' not in resultado:
-            resultado['saldo'] = Decimal('0')
+        if 'saldo' not in acc:
+            acc.saldo = _DECIMAL_ZERO
             if self.debug:
                 print(f"   Saldo definido como 0 (não encontrado)")
 
-        return resultado
-
-    def _extrair_saldos_a_expirar(self, texto: str) -> Dict[str, Any]:
+    def _extrair_saldos_a_expirar(self, texto: str, acc: _SceeAcumulador, inicio: Dict[str, int]):
         """Extract saldos a expirar data."""
-        resultado = {}
 
         if self.debug:
             print(f"[SCEE] Extraindo saldos a expirar...")
 
-        # SALDO A EXPIRAR EM 30 DIAS
-        # PADRÃO TARIFA BRANCA
-        saldo_30_branca_pattern = r'SALDO A EXPIRAR EM 30 DIAS KWH:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)'
-        saldo_30_branca_match = re.search(saldo_30_branca_pattern, texto, re.IGNORECASE)
+        if 'expirar' not in inicio:
+            return
+        pos = max(inicio['expirar'] - len('SALDO A '), 0)
 
-        if saldo_30_branca_match:
-            saldo_30_p = safe_decimal_conversion(saldo_30_branca_match.group(1))
-            saldo_30_fp = safe_decimal_conversion(saldo_30_branca_match.group(2))
-            saldo_30_hr = safe_decimal_conversion(saldo_30_branca_match.group(3))
-            saldo_30_hi = safe_decimal_conversion(saldo_30_branca_match.group(4))
+        # SALDO A EXPIRAR EM 30 DIAS
+        # PADRÃO TARIFA BRANCA ou CONVENCIONAL (uma única varredura)
+        saldo_30_match = _primeiro_saldo(_RE_SALDO_30, texto, pos)
 
-            resultado['saldo_30_p'] = saldo_30_p
-            resultado['saldo_30_fp'] = saldo_30_fp
-            resultado['saldo_30_hr'] = saldo_30_hr
-            resultado['saldo_30_hi'] = saldo_30_hi
-            resultado['saldo_30'] = saldo_30_p + saldo_30_fp + saldo_30_hr + saldo_30_hi
+        if saldo_30_match is not None and saldo_30_match.group(1) is not None:
+            saldo_30_p, saldo_30_fp, saldo_30_hr, saldo_30_hi = _gravar_postos(acc, _CAMPOS_SALDO_30, saldo_30_match)
 
             if self.debug:
                 print(f"   OK: Saldo 30 dias Branca: P={saldo_30_p}, FP={saldo_30_fp}, HR={saldo_30_hr}, HI={saldo_30_hi}")
+        elif saldo_30_match is not None:
+            acc.saldo_30 = _decimal_br(saldo_30_match.group(5))
+            if self.debug:
+                print(f"   OK: Saldo 30 dias: {acc.saldo_30}")
         else:
             # PADRÕES CONVENCIONAL MÚLTIPLOS para 30 dias
-            saldo_30_conv_patterns = [
-                r'SALDO A EXPIRAR EM 30 DIAS KWH:\s*([\d.,]+)(?=,|\s|$)',
-                r'A EXPIRAR EM 30 DIAS.*?([\d.,]+)',
-                r'EXPIRAR.*?30.*?DIAS.*?([\d.,]+)'
-            ]
-
-            for pattern in saldo_30_conv_patterns:
-                saldo_30_conv_match = re.search(pattern, texto, re.IGNORECASE)
+            for pattern in _RE_SALDO_30_CONV:
+                saldo_30_conv_match = pattern.search(texto, pos)
                 if saldo_30_conv_match:
-                    resultado['saldo_30'] = safe_decimal_conversion(saldo_30_conv_match.group(1))
+                    acc.saldo_30 = _decimal_br(saldo_30_conv_match.group(1))
                     if self.debug:
-                        print(f"   OK: Saldo 30 dias: {resultado['saldo_30']}")
+                        print(f"   OK: Saldo 30 dias: {acc.saldo_30}")
                     break
 
         # SALDO A EXPIRAR EM 60 DIAS
-        # PADRÃO TARIFA BRANCA
-        saldo_60_branca_pattern = r'SALDO A EXPIRAR EM 60 DIAS KWH:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)'
-        saldo_60_branca_match = re.search(saldo_60_branca_pattern, texto, re.IGNORECASE)
-
-        if saldo_60_branca_match:
-            saldo_60_p = safe_decimal_conversion(saldo_60_branca_match.group(1))
-            saldo_60_fp = safe_decimal_conversion(saldo_60_branca_match.group(2))
-            saldo_60_hr = safe_decimal_conversion(saldo_60_branca_match.group(3))
-            saldo_60_hi = safe_decimal_conversion(saldo_60_branca_match.group(4))
+        # PADRÃO TARIFA BRANCA ou CONVENCIONAL (uma única varredura)
+        saldo_60_match = _primeiro_saldo(_RE_SALDO_60, texto, pos)
 
-            resultado['saldo_60_p'] = saldo_60_p
-            resultado['saldo_60_fp'] = saldo_60_fp
-            resultado['saldo_60_hr'] = saldo_60_hr
-            resultado['saldo_60_hi'] = saldo_60_hi
-            resultado['saldo_60'] = saldo_60_p + saldo_60_fp + saldo_60_hr + saldo_60_hi
+        if saldo_60_match is not None and saldo_60_match.group(1) is not None:
+            saldo_60_p, saldo_60_fp, saldo_60_hr, saldo_60_hi = _gravar_postos(acc, _CAMPOS_SALDO_60, saldo_60_match)
 
             if self.debug:
                 print(f"   OK: Saldo 60 dias Branca: P={saldo_60_p}, FP={saldo_60_fp}, HR={saldo_60_hr}, HI={saldo_60_hi}")
+        elif saldo_60_match is not None:
+            acc.saldo_60 = _decimal_br(saldo_60_match.group(5))
+            if self.debug:
+                print(f"   OK: Saldo 60 dias: {acc.saldo_60}")
         else:
             # PADRÕES CONVENCIONAL MÚLTIPLOS para 60 dias
-            saldo_60_conv_patterns = [
-                r'SALDO A EXPIRAR EM 60 DIAS KWH:\s*([\d.,]+)(?=,|\s|$)',
-                r'A EXPIRAR EM 60 DIAS.*?([\d.,]+)',
-                r'EXPIRAR.*?60.*?DIAS.*?([\d.,]+)'
-            ]
-
-            for pattern in saldo_60_conv_patterns:
-                saldo_60_conv_match = re.search(pattern, texto, re.IGNORECASE)
+            for pattern in _RE_SALDO_60_CONV:
+                saldo_60_conv_match = pattern.search(texto, pos)
                 if saldo_60_conv_match:
-                    resultado['saldo_60'] = safe_decimal_conversion(saldo_60_conv_match.group(1))
+                    acc.saldo_60 = _decimal_br(saldo_60_conv_match.group(1))
                     if self.debug:
-                        print(f"   OK: Saldo 60 dias: {resultado['saldo_60']}")
+                        print(f"   OK: Saldo 60 dias: {acc.saldo_60}")
                     break
 
-        return resultado
-
-    def _extrair_rateio_geracao(self, texto: str) -> Dict[str, Any]:
+    def _extrair_rateio_geracao(self, texto: str, acc: _SceeAcumulador, inicio: Dict[str, int]):
         """
         Extract generation rateio (distribution) data.
         Based on original CreditosSaldosExtractor logic.
         """
-        resultado = {}
 
         if self.debug:
             print(f"[SCEE] Extraindo rateio de geração...")
 
-        # PADRÃO PRINCIPAL: "CADASTRO RATEIO GERAÇÃO: UC 12345 = 100%"
-        rateio_pattern = r'CADASTRO RATEIO GERAÇÃO:\s*UC\s*(\d+)\s*=\s*([\d.,]+%?)'
-        rateio_match = re.search(rateio_pattern, texto, re.IGNORECASE)
+        if 'rateio' not in inicio:
+            return
+        pos = max(inicio['rateio'] - len('CADASTRO '), 0)
+
+        # PADRÃO PRINCIPAL
+        rateio_match = _RE_RATEIO.search(texto, pos)
 
         if rateio_match:
-            resultado['rateio_fatura'] = rateio_match.group(2)
+            acc.rateio_fatura = rateio_match.group(2)
             if self.debug:
                 print(f"   OK: Rateio: UC {rateio_match.group(1)} = {rateio_match.group(2)}")
 
         # PADRÃO ALTERNATIVO: Múltiplas UCs com percentuais
-        # "RATEIO DA GERAÇÃO: UC 10037114075 (45%), UC 10037114024 (55%)"
-        rateio_multiplo_pattern = r'RATEIO.*?UC\s*(\d+).*?([\d,]+)%'
-        rateios_multiplos = re.findall(rateio_multiplo_pattern, texto, re.IGNORECASE)
+        rateios_multiplos = _RE_RATEIO_MULTIPLO.findall(texto, pos)
 
         if rateios_multiplos:
             for idx, (uc, percentual) in enumerate(rateios_multiplos, 1):
                 if idx <= 3:  # Máximo 3 UGs
-                    resultado[f'uc_geradora_{idx}'] = uc
-                    resultado[f'rateio_{idx}'] = safe_decimal_conversion(percentual) / Decimal('100')  # Converter para decimal
+                    setattr(acc, f'uc_geradora_{idx}', sys.intern(uc))
+                    setattr(acc, f'rateio_{idx}', _decimal_br(percentual) / _DECIMAL_CEM)  # Converter para decimal
 
                     if self.debug:
                         print(f"   OK: Rateio {idx}: UC {uc} = {percentual}%")
 
-        return resultado
-
-    def _extrair_injecao_scee(self, texto: str) -> Dict[str, Any]:
+    def _extrair_injecao_scee(self, texto: str, texto_upper: str, acc: _SceeAcumulador,
+                             inicio: Dict[str, int]):
         """
         Extract data from INJECAO SCEE line in consumption table.
         Format: "INJEÇÃO SCEE - UC 10037100562 - GD I kWh 709,00 0,643844 -456,49"
-        Returns quantidade (709,00) and valor (456,49 positive)
+        Sets quantidade (709,00) and valor (456,49 positive)
+        The full-line pattern runs on texto_upper; the line fallback keeps the original text.
         """
-        resultado = {}
 
         if self.debug:
             print(f"[SCEE] Extraindo dados de injeção...")
 
+        # Both the full-line pattern and the line fallback need an "INJEÇÃO SCEE" row
+        if 'injecao' not in inicio:
+            return
+
         # Look for INJECAO SCEE line and extract values
         # First try to find a fully reconstructed line with all values
-        pattern_completo = r'INJE[ÇC][ÃA]O SCEE.*?kWh\s+([\d.,]+)\s+([\d.,]+)\s+([-]?[\d.,]+)'
-        match_completo = re.search(pattern_completo, texto, re.IGNORECASE)
+        match_completo = _RE_INJECAO_COMPLETA.search(texto_upper, inicio['injecao'])
 
         if match_completo:
             quantidade_str = match_completo.group(1)  # 709,00
@@ -530,8 +782,8 @@ class SCEEExtractor:
             quantidade = self._converter_valor_brasileiro(quantidade_str)
             valor = abs(self._converter_valor_brasileiro(valor_str))  # Always positive
 
-            resultado['energia_injetada'] = quantidade
-            resultado['valor_energia_injetada'] = valor
+            acc.energia_injetada = quantidade
+            acc.valor_energia_injetada = valor
 
             if self.debug:
                 print(f"   Linha INJECAO completa encontrada:")
@@ -541,33 +793,32 @@ class SCEEExtractor:
         else:
             # Fallback: process line by line if full pattern not found
             linhas = texto.split('\n')
+            valores_numericos = []  # reused for every INJECAO line
             for i, linha in enumerate(linhas):
                 if "INJEÇÃO SCEE" in linha or "INJECAO SCEE" in linha:
                     if self.debug:
                         print(f"   Linha INJECAO encontrada: {linha}")
 
                     # Extract UC number
-                    uc_match = re.search(r'UC\s*(\d+)', linha)
+                    uc_match = _RE_UC.search(linha)
                     if uc_match:
                         uc_number = uc_match.group(1)
                         if self.debug:
                             print(f"   UC extraida: {uc_number}")
 
                     # Try to find values in next few lines after INJECAO line
-                    valores_numericos = []
+                    valores_numericos.clear()
                     for j in range(i + 1, min(i + 10, len(linhas))):
                         linha_seguinte = linhas[j].strip()
 
                         # Look for numeric values that could be quantidade/valor
-                        numeric_matches = re.findall(r'([-]?[\d.,]+)', linha_seguinte)
-                        for match in numeric_matches:
-                            if re.match(r'^[-]?[\d.,]+$', match):  # Pure numeric value
-                                valores_numericos.append(match)
+                        valores_numericos.extend(m.group() for m in _NUMERO_INJECAO_RE.finditer(linha_seguinte))
 
                         # Stop if we have enough values or found next item
                         if len(valores_numericos) >= 3:
                             break
-                        if any(word in linha_seguinte.upper() for word in ['CONTRIB', 'ITENS', 'TOTAL']):
+                        linha_seguinte_upper = linha_seguinte.upper()
+                        if any(word in linha_seguinte_upper for word in _FIM_BLOCO_INJECAO):
                             break
 
                     if len(valores_numericos) >= 3:
@@ -576,38 +827,33 @@ class SCEEExtractor:
                         # We want: quantidade = 709,00, valor = 456,49
 
                         # Try to identify which is quantidade (should be larger integer-like) and valor (larger absolute)
+                        # Each value is parsed once: (string, absolute value, signed value)
                         valores_convertidos = []
                         for val in valores_numericos[:5]:  # Check first 5 values
-                            try:
-                                converted = self._converter_valor_brasileiro(val)
-                                valores_convertidos.append((val, abs(converted)))
-                            except:
-                                continue
+                            converted = self._converter_valor_brasileiro(val)
+                            valores_convertidos.append((val, abs(converted), converted))
 
                         if len(valores_convertidos) >= 2:
                             # Sort by absolute value to find the largest ones
                             valores_ordenados = sorted(valores_convertidos, key=lambda x: x[1], reverse=True)
 
                             # Find quantidade: should be the largest value, typically hundreds (709.0)
-                            quantidade_str = valores_ordenados[0][0]
-                            quantidade = self._converter_valor_brasileiro(quantidade_str)
+                            quantidade_str, _, quantidade = valores_ordenados[0]
 
                             # Find valor: should be the largest VALUE among those > 100
                             # Expected pattern: 709.00 (quantidade), 456.49 (valor), smaller values (tarifa, etc)
                             valor_str = None
-                            for val_str, val_abs in valores_ordenados[1:]:  # Skip the quantidade
+                            for val_str, val_abs, _ in valores_ordenados[1:]:  # Skip the quantidade
                                 if val_abs > 100:  # Value should be > 100 for meaningful energy cost
-                                    valor_str = val_str
+                                    valor_str, valor = val_str, val_abs
                                     break
 
                             # Fallback to second largest if no good valor found
                             if not valor_str:
-                                valor_str = valores_ordenados[1][0] if len(valores_ordenados) > 1 else valores_ordenados[0][0]
-
-                            valor = abs(self._converter_valor_brasileiro(valor_str))
+                                valor_str, valor, _ = valores_ordenados[1] if len(valores_ordenados) > 1 else valores_ordenados[0]
 
-                            resultado['energia_injetada'] = quantidade
-                            resultado['valor_energia_injetada'] = valor
+                            acc.energia_injetada = quantidade
+                            acc.valor_energia_injetada = valor
 
                             if self.debug:
                                 print(f"   Valores reconstruidos das linhas seguintes:")
@@ -620,9 +866,7 @@ class SCEEExtractor:
                         if self.debug:
                             print(f"   Valores insuficientes nas linhas seguintes: {valores_numericos}")
 
-        return resultado
-
-    def _tentar_injecao_externa(self, dados: Dict[str, Any], texto_completo: str):
+    def _tentar_injecao_externa(self, acc: _SceeAcumulador, texto_upper: str, inicio: Dict[str, int]):
         """
         Try to get injection data from reconstructed lines (like from B extractor).
         This is a fallback when the basic line-by-line extraction fails.
@@ -632,8 +876,7 @@ class SCEEExtractor:
 
         # Look for patterns that indicate already processed data
         # Pattern from B extractor: "INJEÇÃO SCEE - UC 10037100562 - GD I kWh 709,00 0,643844 -456,49"
-        pattern_completo = r'INJE[ÇC][ÃA]O SCEE.*?kWh\s+([\d.,]+)\s+([\d.,]+)\s+([-]?[\d.,]+)\s+([-]?[\d.,]+)'
-        match = re.search(pattern_completo, texto_completo, re.IGNORECASE)
+        match = _RE_INJECAO_EXTERNA.search(texto_upper, inicio['injecao']) if 'injecao' in inicio else None
 
         if match:
             # Expected: kWh QUANTIDADE TARIFA VALOR_INTERMEDIARIO VALOR_PRINCIPAL
@@ -645,8 +888,8 @@ class SCEEExtractor:
 
             # Only override if we got better values
             if quantidade > 0 and valor_principal > 100:  # Reasonable thresholds
-                dados['energia_injetada'] = quantidade
-                dados['valor_energia_injetada'] = valor_principal
+                acc.energia_injetada = quantidade
+                acc.valor_energia_injetada = valor_principal
 
                 if self.debug:
                     print(f"   Valores de injeção capturados de fonte externa:")
@@ -658,10 +901,10 @@ class SCEEExtractor:
                     print(f"   Valores externos não passaram na validação: qtd={quantidade}, val={valor_principal}")
         else:
             # Final fallback: use credito_recebido as energia_injetada (common pattern)
-            if dados.get('credito_recebido', 0) > 0 and dados.get('energia_injetada', 0) == 0:
-                dados['energia_injetada'] = dados['credito_recebido']
+            if acc.get('credito_recebido', 0) > 0 and acc.get('energia_injetada', 0) == 0:
+                acc.energia_injetada = acc.credito_recebido
                 if self.debug:
-                    print(f"   Fallback: energia_injetada = credito_recebido = {dados['energia_injetada']}")
+                    print(f"   Fallback: energia_injetada = credito_recebido = {acc.energia_injetada}")
 
     def _converter_valor_brasileiro(self, valor_str: str) -> Decimal:
         """
@@ -678,18 +921,14 @@ class SCEEExtractor:
             if is_negative:
                 valor_str = valor_str[1:]
 
-            # Remove thousand separators (dots) and replace comma with dot
-            if ',' in valor_str:
-                # Split by comma to get integer and decimal parts
-                parts = valor_str.split(',')
-                if len(parts) == 2:
-                    integer_part = parts[0].replace('.', '')  # Remove dots from integer part
-                    decimal_part = parts[1]
-                    valor_clean = f"{integer_part}.{decimal_part}"
-                else:
-                    valor_clean = valor_str.replace('.', '').replace(',', '.')
+            # Remove thousand separators (dots) and replace comma with dot.
+            # A single comma splits integer and decimal parts (dots are only
+            # dropped from the integer part); otherwise every dot is dropped.
+            integer_part, comma, decimal_part = valor_str.partition(',')
+            if comma and ',' not in decimal_part:
+                valor_clean = integer_part.replace('.', '') + '.' + decimal_part
             else:
-                valor_clean = valor_str.replace('.', '')  # Only thousand separators
+                valor_clean = valor_str.replace('.', '').replace(',', '.')
 
             result = Decimal(valor_clean)
             return -result if is_negative else result
@@ -697,7 +936,7 @@ class SCEEExtractor:
         except Exception as e:
             if self.debug:
                 print(f"   Erro convertendo valor '{valor_str}': {e}")
-            return Decimal('0')
+            return _DECIMAL_ZERO
 
     def _print_valores_extraidos(self, dados: Dict[str, Any]):
         """
@@ -720,7 +959,7 @@ class SCEEExtractor:
         print(f"   uc_geradora_3: {dados.get('uc_geradora_3', '')}")
         print(f"{'='*60}\n")
 
-    def _processar_dados_ugs(self, dados: Dict[str, Any]):
+    def _processar_dados_ugs(self, acc: _SceeAcumulador):
         """
         Process multiple UG data and set energia_injetada.
         CRITICAL: energia_injetada is used by Calculadora_AUPUS.py
@@ -734,15 +973,15 @@ class SCEEExtractor:
         excedentes = []
 
         # Extrair de registros brutos de geração
-        if '_geracao_ugs_raw' in dados:
-            for item in dados['_geracao_ugs_raw']:
-                total_geracao = item.get('total', Decimal('0'))
+        if '_geracao_ugs_raw' in acc:
+            for item in acc._geracao_ugs_raw:
+                total_geracao = item.total
                 if total_geracao > 0:
                     geracoes.append(total_geracao)
 
                 # Armazenar UCs geradoras (máximo 3)
                 if len(geracoes) <= 3:
-                    dados[f'uc_geradora_{len(geracoes)}'] = item.get('uc', '')
+                    setattr(acc, _CAMPOS_UC_GERADORA[len(geracoes)], item.uc)
 
             if self.debug and geracoes:
                 print(f"   Geracoes encontradas: {len(geracoes)} UGs")
@@ -750,9 +989,9 @@ class SCEEExtractor:
                     print(f"     UG {i}: {geracao} kWh")
 
         # Extrair de registros brutos de excedente
-        if '_excedente_ugs_raw' in dados:
-            for item in dados['_excedente_ugs_raw']:
-                total_excedente = item.get('total', Decimal('0'))
+        if '_excedente_ugs_raw' in acc:
+            for item in acc._excedente_ugs_raw:
+                total_excedente = item.total
                 if total_excedente > 0:
                     excedentes.append(total_excedente)
 
@@ -765,46 +1004,41 @@ class SCEEExtractor:
         # 3. Fallback para soma das geracoes
         # 4. Fallback para soma dos excedentes
 
-        energia_injetada_calculada = Decimal('0')
+        energia_injetada_calculada = _DECIMAL_ZERO
 
-        if dados.get('excedente_recebido', Decimal('0')) > 0:
-            energia_injetada_calculada = dados['excedente_recebido']
+        if acc.get('excedente_recebido', _DECIMAL_ZERO) > 0:
+            energia_injetada_calculada = acc.excedente_recebido
             if self.debug:
                 print(f"   energia_injetada = excedente_recebido: {energia_injetada_calculada}")
-        elif dados.get('geracao_ciclo', Decimal('0')) > 0:
-            energia_injetada_calculada = dados['geracao_ciclo']
+        elif acc.get('geracao_ciclo', _DECIMAL_ZERO) > 0:
+            energia_injetada_calculada = acc.geracao_ciclo
             if self.debug:
                 print(f"   energia_injetada = geracao_ciclo: {energia_injetada_calculada}")
         elif geracoes:
-            energia_injetada_calculada = sum(geracoes)
+            energia_injetada_calculada = geracoes[0] + geracoes[1] if len(geracoes) > 1 else geracoes[0]
             if self.debug:
                 print(f"   energia_injetada = soma geracoes: {energia_injetada_calculada}")
         elif excedentes:
-            energia_injetada_calculada = sum(excedentes)
+            energia_injetada_calculada = excedentes[0] + excedentes[1] if len(excedentes) > 1 else excedentes[0]
             if self.debug:
                 print(f"   energia_injetada = soma excedentes: {energia_injetada_calculada}")
         else:
-            energia_injetada_calculada = Decimal('0')
+            energia_injetada_calculada = _DECIMAL_ZERO
             if self.debug:
                 print(f"   energia_injetada = 0 (nenhum dado encontrado)")
 
         # CRITICAL: Set energia_injetada (usado pela Calculadora_AUPUS.py)
-        dados['energia_injetada'] = energia_injetada_calculada
+        acc.energia_injetada = energia_injetada_calculada
 
         # Garantir que UCs geradoras existam mesmo que vazias
-        for i in range(1, 4):  # uc_geradora_1, uc_geradora_2, uc_geradora_3
-            uc_key = f'uc_geradora_{i}'
-            if uc_key not in dados:
-                dados[uc_key] = ''
-
-        # Limpar campos internos temporarios
-        dados.pop('_geracao_ugs_raw', None)
-        dados.pop('_excedente_ugs_raw', None)
+        for uc_key in _CAMPOS_UC_GERADORA[1:]:  # uc_geradora_1, uc_geradora_2, uc_geradora_3
+            if uc_key not in acc:
+                setattr(acc, uc_key, '')
 
         if self.debug:
             print(f"[SCEE] Processamento UGs concluído:")
-            print(f"   energia_injetada FINAL: {dados['energia_injetada']}")
-            print(f"   UCs geradoras: {dados.get('uc_geradora_1', '')}, {dados.get('uc_geradora_2', '')}, {dados.get('uc_geradora_3', '')}")
+            print(f"   energia_injetada FINAL: {acc.energia_injetada}")
+            print(f"   UCs geradoras: {acc.uc_geradora_1}, {acc.uc_geradora_2}, {acc.uc_geradora_3}")
 
     def _default_scee_values(self) -> Dict[str, Any]:
         """
@@ -814,25 +1048,11 @@ class SCEEExtractor:
         if self.debug:
             print(f"[SCEE] Aplicando valores padrão (sem SCEE)")
 
-        return {
-            # Saldos principais
-            'saldo': Decimal('0'),
-            'saldo_30': Decimal('0'),
-            'saldo_60': Decimal('0'),
-
-            # Energias
-            'excedente_recebido': Decimal('0'),
-            'credito_recebido': Decimal('0'),
-            'energia_injetada': Decimal('0'),  # CRITICAL para Calculadora_AUPUS
-            'geracao_ciclo': Decimal('0'),
-
-            # UCs geradoras
-            'uc_geradora_1': '',
-            'uc_geradora_2': '',
-            'uc_geradora_3': '',
-
-            # Rateios
-            'rateio_1': Decimal('0'),
-            'rateio_2': Decimal('0'),
-            'rateio_3': Decimal('0')
-        }
\ No newline at end of file
+        return _DEFAULT_SCEE.copy()  # values are immutable, a shallow copy is enough
+
+
+def _extrair_scee_sem_debug(texto_completo: str) -> Dict[str, Any]:
+    """Worker for SCEEExtractor.extract_many (module level so it can be pickled)."""
+    extractor = SCEEExtractor()
+    extractor.debug = False
+    return extractor.extract_scee_data(texto_completo)
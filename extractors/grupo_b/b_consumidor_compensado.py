@@ -16,6 +16,63 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from core.base_extractor import BaseExtractor, safe_decimal_conversion
 
 
+# Per-line extraction trace on stdout; off by default like the SCEE trace
+_DEBUG_B_COMPENSADO = False
+
+# Compiled SCEE line patterns (searched on every SCEE text block)
+# "GERAÇÃO CICLO (6/2025) KWH: UC 10037114075 : 58.010,82"
+_RE_GERACAO = re.compile(r'GERAÇÃO CICLO.*?KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)', re.IGNORECASE)
+# "UC 10037114024 : P=0,40, FP=18.781,95, HR=0,00, HI=0,00"
+_RE_GERACAO_BRANCA = re.compile(r'UC\s*(\d+)\s*:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)', re.IGNORECASE)
+# "EXCEDENTE RECEBIDO KWH: UC 10037114075 : 16.370,65"
+_RE_EXCEDENTE = re.compile(r'EXCEDENTE RECEBIDO KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)', re.IGNORECASE)
+# Tried in order, first match wins
+_RE_CREDITO = (
+    re.compile(r'CRÉDITO RECEBIDO.*?(\d+,\d+)', re.IGNORECASE),
+    re.compile(r'CREDITO RECEBIDO.*?(\d+,\d+)', re.IGNORECASE),
+    re.compile(r'CRÉDITO.*?(\d+,\d+)', re.IGNORECASE),
+    re.compile(r'(\d+,\d+).*CRÉDITO', re.IGNORECASE),
+)
+_RE_SALDO = (
+    re.compile(r'SALDO.*?(\d+,\d+)', re.IGNORECASE),
+    re.compile(r'(\d+,\d+).*SALDO', re.IGNORECASE),
+    re.compile(r'SALDO KWH.*?(\d+,\d+)', re.IGNORECASE),
+)
+# Monetary values in juros/multa/iluminação lines
+_RE_VALOR_MONETARIO = re.compile(r'\d+[,.]\d+')
+
+# Alphabetic strings that float() accepts
+_VALORES_FLOAT_ESPECIAIS = ('inf', 'infinity', 'nan')
+
+# Line classifiers (matched against the upper-cased line)
+_INDICADORES_INICIO_CONSUMO = (
+    "ADC BANDEIRA VERMELHA", "ADICIONAL BANDEIRA",
+    "CONSUMO NAO COMPENSADO", "CONSUMO NÃO COMPENSADO",
+    "CONSUMO SCEE",
+    "INJECAO SCEE", "INJEÇÃO SCEE"
+)
+_INDICADORES_CONSUMO = (
+    "CONSUMO NÃO COMPENSADO", "CONSUMO NAO COMPENSADO",
+    "CONSUMO SCEE", "CONSUMO COMPENSADO",
+    "ADC BANDEIRA", "ADICIONAL BANDEIRA", "BANDEIRA",
+    "INJEÇÃO SCEE", "INJECAO SCEE", "INJECÃO SCEE"
+)
+_INDICADORES_SCEE = (
+    "INFORMAÇÕES DO SCEE", "INFORMACOES DO SCEE",
+    "CRÉDITO DE ENERGIA", "CREDITO DE ENERGIA", "SCEE:",
+    "EXCEDENTE RECEBIDO", "GERAÇÃO CICLO", "GERACAO CICLO",
+    "SALDO KWH", "CRÉDITO RECEBIDO", "CREDITO RECEBIDO",
+    "ENERGIA INJETADA", "SISTEMA DE COMPENSAÇÃO"
+)
+_INDICADORES_FINANCEIROS = ("JUROS", "MULTA", "ILUMINAÇÃO", "ILUMINACAO", "CONTRIB")
+
+# BRANCA compensation totals summed from their _p/_fp/_hi postos (key, debug label)
+_TOTAIS_COMPENSACAO_BRANCA = (
+    ("consumo_comp", "Consumo compensado total B Branca"),
+    ("consumo_n_comp", "Consumo não compensado total B Branca"),
+)
+
+
 class BConsumidorCompensadoExtractor(BaseExtractor):
     """
     Extractor for Group B consumers with SCEE compensation.
@@ -33,6 +90,7 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
 
     def __init__(self):
         super().__init__()
+        self.debug = _DEBUG_B_COMPENSADO
 
         # Accumulators for consumption data (maintain structure from original)
         self.consumo_comp: Dict[str, Decimal] = {}
@@ -81,8 +139,7 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
             self._reset_accumulators()
 
             # Process all pages
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
+            for page_num, page in enumerate(doc):
                 self._processar_pagina(page, page_num, doc)
 
             # Finalize and build result
@@ -138,9 +195,11 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
             # Extract full text and reconstruct proper lines for consumption data
             texto_completo = page.get_text()
             linhas_brutas = [linha.strip() for linha in texto_completo.split('\n') if linha.strip()]
+            # Upper-cased once per page, shared by reconstruction and classifiers
+            linhas_upper = [linha.upper() for linha in linhas_brutas]
 
             # Reconstruct consumption lines by looking for patterns
-            linhas_processadas = self._reconstruct_consumption_lines(linhas_brutas)
+            linhas_processadas = self._reconstruct_consumption_lines(linhas_brutas, linhas_upper)
 
             # Add debug print
             if self.debug:
@@ -163,85 +222,57 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
                     self._processar_linha_consumo_new(linha)
 
             # Process original lines for SCEE and other data
-            for linha in linhas_brutas:
-                if self._is_scee_line(linha):
+            for linha, linha_upper in zip(linhas_brutas, linhas_upper):
+                if self._is_scee_line(linha_upper):
                     self._processar_linha_scee(linha)
-                elif self._is_financial_line_new(linha):
+                elif self._is_financial_line_new(linha_upper):
                     self._processar_linha_financeira_new(linha)
 
         except Exception as e:
             if self.debug:
                 print(f"AVISO: Erro processando página {page_num}: {e}")
 
-    def _processar_bloco_texto(self, text: str, block_info: Dict):
-        """
-        Process a text block and extract relevant data.
-        Based on original ConsumoExtractor logic.
-        """
-        x0, y0 = block_info.get('x0', 0), block_info.get('y0', 0)
-
-        # Check if within main table area (from original system)
-        if not (30 <= x0 <= 650 and 350 <= y0 <= 755):
-            # Also check for SCEE data which can be outside main table
-            if not self._is_scee_text(text):
-                return
-
-        parts = text.split()
-        if not parts:
-            return
-
-        # Identify line type and process accordingly
-        if self._is_consumption_line(text, parts):
-            self._processar_linha_consumo(text, parts)
-        elif self._is_scee_line(text):
-            self._processar_linha_scee(text)
-        elif self._is_bandeira_line(text, parts):
-            self._processar_linha_bandeira(text, parts)
-        elif self._is_financial_line(text, parts):
-            self._processar_linha_financeira(text, parts)
-
-    def _reconstruct_consumption_lines(self, linhas_brutas: List[str]) -> List[str]:
+    def _reconstruct_consumption_lines(self, linhas_brutas: List[str],
+                                       linhas_upper: List[str]) -> List[str]:
         """
         Reconstruct consumption lines from separated text fragments.
         Based on the debug output, we need to combine:
         - Item name (e.g., "ADC BANDEIRA VERMELHA")
         - "kWh"
         - Numbers (tarifa, quantidade, valor)
+        linhas_upper holds the same lines upper-cased, index for index.
         """
         linhas_processadas = []
+        total_linhas = len(linhas_brutas)
 
         # Look for consumption indicators in sequential lines
-        consumption_indicators = [
-            "ADC BANDEIRA VERMELHA", "ADICIONAL BANDEIRA",
-            "CONSUMO NAO COMPENSADO", "CONSUMO NÃO COMPENSADO",
-            "CONSUMO SCEE",
-            "INJECAO SCEE", "INJEÇÃO SCEE"
-        ]
-
         i = 0
-        while i < len(linhas_brutas):
+        while i < total_linhas:
             linha_atual = linhas_brutas[i]
 
             # Check if current line is a consumption indicator
-            is_consumption_start = any(indicator in linha_atual.upper() for indicator in consumption_indicators)
+            linha_atual_upper = linhas_upper[i]
+            is_consumption_start = any(indicator in linha_atual_upper for indicator in _INDICADORES_INICIO_CONSUMO)
 
             if is_consumption_start:
-                # Reconstruct the full consumption line
-                linha_completa = linha_atual
+                # Reconstruct the full consumption line (pieces joined once below)
+                partes_linha = [linha_atual]
 
                 # Look ahead for kWh and numeric values
                 j = i + 1
                 valores_encontrados = []
 
                 # Collect next few lines to reconstruct the consumption line
-                while j < min(i + 10, len(linhas_brutas)):  # Look ahead max 10 lines
+                fim_janela = min(i + 10, total_linhas)  # Look ahead max 10 lines
+                while j < fim_janela:
                     próxima_linha = linhas_brutas[j]
+                    próxima_linha_upper = linhas_upper[j]
 
                     if "kWh" in próxima_linha or "KWH" in próxima_linha:
-                        linha_completa += " " + próxima_linha
+                        partes_linha.append(próxima_linha)
                     elif self._is_numeric_value(próxima_linha):
                         valores_encontrados.append(próxima_linha)
-                        linha_completa += " " + próxima_linha
+                        partes_linha.append(próxima_linha)
 
                         # Stop when we have enough values (at least 5: tarifa, quantidade, valor_intermediario, valor_final)
                         if len(valores_encontrados) >= 5:
@@ -249,12 +280,13 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
                     elif próxima_linha in ["19%", "%"] or próxima_linha.endswith("%"):
                         # Skip percentage lines but continue
                         pass
-                    elif any(indicator in próxima_linha.upper() for indicator in consumption_indicators):
+                    elif any(indicator in próxima_linha_upper for indicator in _INDICADORES_INICIO_CONSUMO):
                         # Found another consumption line, stop here
                         break
 
                     j += 1
 
+                linha_completa = " ".join(partes_linha)
                 if "kWh" in linha_completa and len(valores_encontrados) >= 2:
                     linhas_processadas.append(linha_completa)
                     if self.debug:
@@ -276,47 +308,19 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
         # "ADC BANDEIRA VERMELHA kWh 100,00 0,101814 10,18"
         # "INJEÇÃO SCEE - UC 10037100562 - GD I kWh 709,00 0,643844 -456,49"
 
-        indicators = [
-            "CONSUMO NÃO COMPENSADO", "CONSUMO NAO COMPENSADO",
-            "CONSUMO SCEE", "CONSUMO COMPENSADO",
-            "ADC BANDEIRA", "ADICIONAL BANDEIRA", "BANDEIRA",
-            "INJEÇÃO SCEE", "INJECAO SCEE", "INJECÃO SCEE"
-        ]
-
-        has_indicator = any(indicator in linha_upper for indicator in indicators)
+        has_indicator = any(indicator in linha_upper for indicator in _INDICADORES_CONSUMO)
         has_kwh = "KWH" in linha_upper or "kWh" in linha
         has_values = any(char.isdigit() for char in linha) and "," in linha
 
         return has_indicator and has_kwh and has_values
 
-    def _is_scee_text(self, text: str) -> bool:
-        """Check if text contains SCEE information."""
-        scee_indicators = [
-            "INFORMAÇÕES DO SCEE", "INFORMACOES DO SCEE",
-            "CRÉDITO DE ENERGIA", "CREDITO DE ENERGIA", "SCEE:",
-            "EXCEDENTE RECEBIDO", "GERAÇÃO CICLO", "GERACAO CICLO",
-            "SALDO KWH", "CRÉDITO RECEBIDO", "CREDITO RECEBIDO",
-            "ENERGIA INJETADA", "SISTEMA DE COMPENSAÇÃO"
-        ]
-
-        return any(indicator in text.upper() for indicator in scee_indicators)
+    def _is_scee_line(self, linha_upper: str) -> bool:
+        """Check if (upper-cased) line is SCEE data line."""
+        return any(indicator in linha_upper for indicator in _INDICADORES_SCEE)
 
-    def _is_scee_line(self, text: str) -> bool:
-        """Check if line is SCEE data line."""
-        return self._is_scee_text(text)
-
-    def _is_bandeira_line_new(self, linha: str) -> bool:
-        """Check if line contains bandeira tarifária data - NEW VERSION."""
-        linha_upper = linha.upper()
-        bandeira_indicators = ["ADC BANDEIRA", "ADICIONAL BANDEIRA", "BANDEIRA"]
-        has_kwh = "KWH" in linha_upper or "kWh" in linha
-        return any(indicator in linha_upper for indicator in bandeira_indicators) and has_kwh
-
-    def _is_financial_line_new(self, linha: str) -> bool:
-        """Check if line contains financial data (juros, multa, etc) - NEW VERSION."""
-        linha_upper = linha.upper()
-        financial_indicators = ["JUROS", "MULTA", "ILUMINAÇÃO", "ILUMINACAO", "CONTRIB"]
-        return any(indicator in linha_upper for indicator in financial_indicators)
+    def _is_financial_line_new(self, linha_upper: str) -> bool:
+        """Check if (upper-cased) line contains financial data (juros, multa, etc) - NEW VERSION."""
+        return any(indicator in linha_upper for indicator in _INDICADORES_FINANCEIROS)
 
     def _processar_linha_consumo_new(self, linha: str):
         """
@@ -384,16 +388,6 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
             if self.debug:
                 print(f"   ERRO processando linha consumo: {e}")
 
-    def _find_correct_kwh_index(self, parts: List[str]) -> int:
-        """
-        Find the correct kWh index in parts list.
-        Migrated from original system.
-        """
-        for i, part in enumerate(parts):
-            if part.upper() in ['KWH', 'kWh']:
-                return i
-        return -1
-
     def _identificar_tipo_consumo_new(self, linha: str) -> str:
         """
         Identify consumption type from line - NEW VERSION.
@@ -426,20 +420,12 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
 
         elif tipo == "bandeira":
             # Store bandeira data in separate variables
-            if not hasattr(self, 'bandeira_quantidade'):
-                self.bandeira_quantidade = Decimal('0')
-                self.bandeira_valor = Decimal('0')
-
             self.bandeira_quantidade = quantidade
             self.bandeira_valor = valor
             self.bandeira_codigo = 1  # Assume vermelha if detected
 
         elif tipo == "injecao":
             # Store injection data
-            if not hasattr(self, 'injecao_quantidade'):
-                self.injecao_quantidade = Decimal('0')
-                self.injecao_valor = Decimal('0')
-
             self.injecao_quantidade = quantidade
             self.injecao_valor = valor
 
@@ -465,14 +451,15 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
         # Extract credit data
         self._extrair_credito_recebido(text)
 
-        # Extract saldo data
-        self._extrair_saldo_energia(text)
+        # Saldo is only reported here (nothing is stored), so skip the
+        # pattern scans outside debug mode
+        if self.debug:
+            self._extrair_saldo_energia(text)
 
     def _extrair_geracao_ciclo(self, text: str):
         """Extract geração ciclo data."""
         # Pattern: "GERAÇÃO CICLO (6/2025) KWH: UC 10037114075 : 58.010,82"
-        geracao_pattern = r'GERAÇÃO CICLO.*?KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)'
-        geracao_match = re.search(geracao_pattern, text, re.IGNORECASE)
+        geracao_match = _RE_GERACAO.search(text)
 
         if geracao_match:
             uc_geradora = geracao_match.group(1)
@@ -488,8 +475,7 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
                 print(f"   OK: Geração detectada: UC {uc_geradora}, Total: {geracao_total}")
 
         # Pattern for BRANCA: "UC 10037114024 : P=0,40, FP=18.781,95, HR=0,00, HI=0,00"
-        geracao_branca_pattern = r'UC\s*(\d+)\s*:\s*P=([\d.,]+),\s*FP=([\d.,]+),\s*HR=([\d.,]+),\s*HI=([\d.,]+)'
-        geracao_branca_match = re.search(geracao_branca_pattern, text, re.IGNORECASE)
+        geracao_branca_match = _RE_GERACAO_BRANCA.search(text)
 
         if geracao_branca_match:
             uc_geradora = geracao_branca_match.group(1)
@@ -516,8 +502,7 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
     def _extrair_excedente_recebido(self, text: str):
         """Extract excedente recebido data."""
         # Pattern: "EXCEDENTE RECEBIDO KWH: UC 10037114075 : 16.370,65"
-        excedente_pattern = r'EXCEDENTE RECEBIDO KWH:\s*UC\s*(\d+)\s*:\s*([\d.,]+)'
-        excedente_match = re.search(excedente_pattern, text, re.IGNORECASE)
+        excedente_match = _RE_EXCEDENTE.search(text)
 
         if excedente_match:
             uc = excedente_match.group(1)
@@ -534,15 +519,8 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
     def _extrair_credito_recebido(self, text: str):
         """Extract crédito recebido data."""
         # Patterns for credit
-        credit_patterns = [
-            r'CRÉDITO RECEBIDO.*?(\d+,\d+)',
-            r'CREDITO RECEBIDO.*?(\d+,\d+)',
-            r'CRÉDITO.*?(\d+,\d+)',
-            r'(\d+,\d+).*CRÉDITO'
-        ]
-
-        for pattern in credit_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _RE_CREDITO:
+            match = pattern.search(text)
             if match:
                 credito = safe_decimal_conversion(match.group(1))
                 self.creditos_total += credito
@@ -554,14 +532,8 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
     def _extrair_saldo_energia(self, text: str):
         """Extract saldo energia data."""
         # Look for saldo patterns
-        saldo_patterns = [
-            r'SALDO.*?(\d+,\d+)',
-            r'(\d+,\d+).*SALDO',
-            r'SALDO KWH.*?(\d+,\d+)'
-        ]
-
-        for pattern in saldo_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _RE_SALDO:
+            match = pattern.search(text)
             if match:
                 saldo = safe_decimal_conversion(match.group(1))
                 # Store saldo (will be processed in finalization)
@@ -569,40 +541,6 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
                     print(f"   OK: Saldo detectado: {saldo}")
                 break
 
-    def _processar_linha_bandeira_new(self, linha: str):
-        """Process bandeira tarifária line - NEW VERSION."""
-        try:
-            # Use the same processing as consumption line
-            self._processar_linha_consumo_new(linha)
-        except Exception as e:
-            if self.debug:
-                print(f"AVISO: Erro processando bandeira: {e}")
-
-    def _extrair_bandeira(self, tipo: str, text: str, parts: List[str]):
-        """Extract bandeira data."""
-        try:
-            # Find numeric value in parts for bandeira cost
-            for part in parts:
-                if self._is_monetary_value(part):
-                    valor = safe_decimal_conversion(part)
-
-                    # Store bandeira data based on type
-                    if tipo == "amarela":
-                        self.bandeira_codigo = 2
-                        if self.debug:
-                            print(f"   OK: Bandeira Amarela detectada: R$ {valor}")
-                    elif tipo == "vermelha":
-                        if self.bandeira_codigo == 2:
-                            self.bandeira_codigo = 3  # Vermelha + Amarela
-                        else:
-                            self.bandeira_codigo = 1
-                        if self.debug:
-                            print(f"   OK: Bandeira Vermelha detectada: R$ {valor}")
-                    break
-        except Exception as e:
-            if self.debug:
-                print(f"AVISO: Erro extraindo bandeira: {e}")
-
     def _processar_linha_financeira_new(self, linha: str):
         """Process financial line (juros, multa, iluminação) - NEW VERSION."""
         linha_upper = linha.upper()
@@ -610,44 +548,17 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
             self._extrair_juros_new(linha)
         elif "MULTA" in linha_upper:
             self._extrair_multa_new(linha)
-        elif "ILUMINAÇÃO" in linha_upper or "ILUMINACAO" in linha_upper:
+        elif self.debug and ("ILUMINAÇÃO" in linha_upper or "ILUMINACAO" in linha_upper):
+            # Iluminação is only reported, never stored
             self._extrair_iluminacao_new(linha)
 
-    def _extrair_juros(self, text: str, parts: List[str]):
-        """Extract juros data."""
-        # Find numeric value in parts
-        for part in parts:
-            if self._is_monetary_value(part):
-                valor = safe_decimal_conversion(part)
-                self.juros_total += valor
-                if self.debug:
-                    print(f"   OK: Juros detectado: R$ {valor}")
-                break
-
-    def _extrair_multa(self, text: str, parts: List[str]):
-        """Extract multa data."""
-        # Find numeric value in parts
-        for part in parts:
-            if self._is_monetary_value(part):
-                valor = safe_decimal_conversion(part)
-                self.multa_total += valor
-                if self.debug:
-                    print(f"   OK: Multa detectada: R$ {valor}")
-                break
-
-    def _extrair_iluminacao(self, text: str, parts: List[str]):
-        """Extract iluminação data."""
-        # Find numeric value in parts
-        for part in parts:
-            if self._is_monetary_value(part):
-                valor = safe_decimal_conversion(part)
-                # Store iluminação value (would be added to result in finalization)
-                if self.debug:
-                    print(f"   OK: Iluminação detectada: R$ {valor}")
-                break
-
     def _is_numeric_value(self, text: str) -> bool:
         """Check if text represents a numeric value."""
+        # Words ("CONSUMO", "kWh") only parse as float's special values:
+        # answer without raising and catching a ValueError
+        if text.isalpha():
+            return text.lower() in _VALORES_FLOAT_ESPECIAIS
+
         try:
             # Remove common formatting
             cleaned = text.replace('.', '').replace(',', '.').replace(' ', '')
@@ -689,44 +600,36 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
                 print(f"   Erro convertendo valor '{valor_str}': {e}")
             return Decimal('0')
 
+    def _primeiro_valor_monetario(self, linha: str) -> Optional[Decimal]:
+        """First monetary value in line, or None (matches are scanned lazily)."""
+        for match in _RE_VALOR_MONETARIO.finditer(linha):
+            valor_str = match.group()
+            if self._is_monetary_value(valor_str):
+                return self._convert_value_with_comma(valor_str)
+        return None
+
     def _extrair_juros_new(self, linha: str):
         """Extract juros data - NEW VERSION."""
-        import re
-        # Look for monetary values in line
-        valores = re.findall(r'\d+[,.]\d+', linha)
-        for valor_str in valores:
-            if self._is_monetary_value(valor_str):
-                valor = self._convert_value_with_comma(valor_str)
-                self.juros_total += valor
-                if self.debug:
-                    print(f"   Juros detectado: R$ {valor}")
-                break
+        valor = self._primeiro_valor_monetario(linha)
+        if valor is not None:
+            self.juros_total += valor
+            if self.debug:
+                print(f"   Juros detectado: R$ {valor}")
 
     def _extrair_multa_new(self, linha: str):
         """Extract multa data - NEW VERSION."""
-        import re
-        # Look for monetary values in line
-        valores = re.findall(r'\d+[,.]\d+', linha)
-        for valor_str in valores:
-            if self._is_monetary_value(valor_str):
-                valor = self._convert_value_with_comma(valor_str)
-                self.multa_total += valor
-                if self.debug:
-                    print(f"   Multa detectada: R$ {valor}")
-                break
+        valor = self._primeiro_valor_monetario(linha)
+        if valor is not None:
+            self.multa_total += valor
+            if self.debug:
+                print(f"   Multa detectada: R$ {valor}")
 
     def _extrair_iluminacao_new(self, linha: str):
         """Extract iluminação data - NEW VERSION."""
-        import re
-        # Look for monetary values in line
-        valores = re.findall(r'\d+[,.]\d+', linha)
-        for valor_str in valores:
-            if self._is_monetary_value(valor_str):
-                valor = self._convert_value_with_comma(valor_str)
-                # Store illumination value (can be added to financial data)
-                if self.debug:
-                    print(f"   Iluminacao detectada: R$ {valor}")
-                break
+        valor = self._primeiro_valor_monetario(linha)
+        # Store illumination value (can be added to financial data)
+        if valor is not None and self.debug:
+            print(f"   Iluminacao detectada: R$ {valor}")
 
     def _finalizar_extracao(self) -> Dict[str, Any]:
         """
@@ -744,12 +647,12 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
         result.update(self.valor_consumo_n_comp)
 
         # Add bandeira data
-        if hasattr(self, 'bandeira_quantidade') and self.bandeira_quantidade > 0:
+        if self.bandeira_quantidade > 0:
             result['bandeira_quantidade'] = self.bandeira_quantidade
             result['bandeira_valor'] = self.bandeira_valor
 
         # Add injection data
-        if hasattr(self, 'injecao_quantidade') and self.injecao_quantidade > 0:
+        if self.injecao_quantidade > 0:
             result['injecao_quantidade'] = self.injecao_quantidade
             result['injecao_valor'] = self.injecao_valor
 
@@ -785,15 +688,16 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
 
     def _processar_dados_scee(self, result: Dict[str, Any]):
         """Process SCEE data and add to result."""
-        # Add generation data
-        if self.geracao_registros:
-            for i, registro in enumerate(self.geracao_registros):
-                if i == 0:
-                    result['uc_geradora_1'] = registro['uc']
-                    result['geracao_ciclo'] = registro['total']
-                elif i == 1:
-                    result['uc_geradora_2'] = registro['uc']
-                    result['geracao_ugs_2'] = registro['total']
+        # Add generation data, summing energia_injetada in the same pass
+        energia_injetada_total = Decimal('0')
+        for i, registro in enumerate(self.geracao_registros):
+            energia_injetada_total += registro['total']
+            if i == 0:
+                result['uc_geradora_1'] = registro['uc']
+                result['geracao_ciclo'] = registro['total']
+            elif i == 1:
+                result['uc_geradora_2'] = registro['uc']
+                result['geracao_ugs_2'] = registro['total']
 
         # Add excedente data
         excedente_total = sum(reg['total'] for reg in self.excedente_registros)
@@ -804,8 +708,7 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
         if self.creditos_total > 0:
             result['credito_recebido'] = self.creditos_total
 
-        # Calculate energia_injetada (sum of generation)
-        energia_injetada_total = sum(reg['total'] for reg in self.geracao_registros)
+        # energia_injetada (sum of generation)
         if energia_injetada_total > 0:
             result['energia_injetada'] = energia_injetada_total
 
@@ -859,27 +762,17 @@ class BConsumidorCompensadoExtractor(BaseExtractor):
                 if self.debug:
                     print(f"OK: Consumo total B Branca: {result['consumo']}")
 
-        # Calculate compensated total
-        consumo_comp_p = to_decimal(result.get('consumo_comp_p', 0))
-        consumo_comp_fp = to_decimal(result.get('consumo_comp_fp', 0))
-        consumo_comp_hi = to_decimal(result.get('consumo_comp_hi', 0))
-
-        if consumo_comp_p > 0 or consumo_comp_fp > 0 or consumo_comp_hi > 0:
-            total_comp = consumo_comp_p + consumo_comp_fp + consumo_comp_hi
-            result['consumo_comp'] = total_comp
-            if self.debug:
-                print(f"OK: Consumo compensado total B Branca: {total_comp}")
-
-        # Calculate non-compensated total
-        consumo_n_comp_p = to_decimal(result.get('consumo_n_comp_p', 0))
-        consumo_n_comp_fp = to_decimal(result.get('consumo_n_comp_fp', 0))
-        consumo_n_comp_hi = to_decimal(result.get('consumo_n_comp_hi', 0))
+        # Calculate compensated and non-compensated totals
+        for total_key, descricao in _TOTAIS_COMPENSACAO_BRANCA:
+            valor_p = to_decimal(result.get(f'{total_key}_p', 0))
+            valor_fp = to_decimal(result.get(f'{total_key}_fp', 0))
+            valor_hi = to_decimal(result.get(f'{total_key}_hi', 0))
 
-        if consumo_n_comp_p > 0 or consumo_n_comp_fp > 0 or consumo_n_comp_hi > 0:
-            total_n_comp = consumo_n_comp_p + consumo_n_comp_fp + consumo_n_comp_hi
-            result['consumo_n_comp'] = total_n_comp
-            if self.debug:
-                print(f"OK: Consumo não compensado total B Branca: {total_n_comp}")
+            if valor_p > 0 or valor_fp > 0 or valor_hi > 0:
+                total = valor_p + valor_fp + valor_hi
+                result[total_key] = total
+                if self.debug:
+                    print(f"OK: {descricao}: {total}")
 
     def _imprimir_relatorio_extracao(self, pdf_path: str, dados: Dict[str, Any]):
         """Print extraction report for debugging."""
@@ -16,6 +16,22 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from core.base_extractor import BaseExtractor, safe_decimal_conversion
 
 
+# Per-span extraction trace on stdout; off by default like the SCEE trace
+_DEBUG_B_SIMPLES = False
+
+# get_text("dict") flags without TEXT_PRESERVE_IMAGES: image blocks are
+# skipped below, so there is no point copying their pixel data into Python
+_FLAGS_TEXTO_DICT = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Alphabetic strings that float() accepts
+_VALORES_FLOAT_ESPECIAIS = ('inf', 'infinity', 'nan')
+
+# Line classifiers (matched against the upper-cased span text)
+_TERMOS_SCEE = ("COMPENSADO", "EXCEDENTE", "SCEE", "CRÉDITO", "CREDITO")
+_INDICADORES_BANDEIRA = ("BANDEIRA", "ADICIONAL")
+_INDICADORES_FINANCEIROS = ("JUROS", "MULTA", "ILUMINAÇÃO", "ILUMINACAO")
+
+
 class BConsumidorSimplesExtractor(BaseExtractor):
     """
     Extractor for Group B simple consumers (without SCEE compensation).
@@ -30,6 +46,7 @@ class BConsumidorSimplesExtractor(BaseExtractor):
 
     def __init__(self):
         super().__init__()
+        self.debug = _DEBUG_B_SIMPLES
 
         # General consumption (CONVENCIONAL)
         self.consumo_geral: Optional[Decimal] = None
@@ -64,8 +81,7 @@ class BConsumidorSimplesExtractor(BaseExtractor):
             self._reset_accumulators()
 
             # Process all pages
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
+            for page_num, page in enumerate(doc):
                 self._processar_pagina(page, page_num, doc)
 
             # Finalize and build result
@@ -107,7 +123,7 @@ class BConsumidorSimplesExtractor(BaseExtractor):
         """
         try:
             # Extract text blocks with position information
-            blocks = page.get_text("dict")["blocks"]
+            blocks = page.get_text("dict", flags=_FLAGS_TEXTO_DICT)["blocks"]
 
             for block in blocks:
                 if "lines" in block:
@@ -144,35 +160,38 @@ class BConsumidorSimplesExtractor(BaseExtractor):
         if not parts:
             return
 
+        # Upper-case once for every classifier below
+        text_upper = text.upper()
+
         # Identify line type and process accordingly
-        if self._is_consumption_line(text, parts):
+        if self._is_consumption_line(text_upper, parts):
             self._processar_linha_consumo(text, parts)
-        elif self._is_bandeira_line(text, parts):
-            self._processar_linha_bandeira(text, parts)
-        elif self._is_financial_line(text, parts):
-            self._processar_linha_financeira(text, parts)
-
-    def _is_consumption_line(self, text: str, parts: List[str]) -> bool:
-        """Check if line contains consumption data."""
-        # Must have kWh indicator and numeric values
-        has_kwh = any(indicator in text.upper() for indicator in ["KWH", "kWh"])
-        has_numeric = any(self._is_numeric_value(part) for part in parts)
+        elif self._is_bandeira_line(text_upper, parts):
+            self._processar_linha_bandeira(text_upper, parts)
+        elif self._is_financial_line(text_upper, parts):
+            self._processar_linha_financeira(text_upper, parts)
+
+    def _is_consumption_line(self, text_upper: str, parts: List[str]) -> bool:
+        """Check if (upper-cased) line contains consumption data."""
+        # Cheapest tests first: most spans are short labels without kWh,
+        # and those never reach the per-token numeric scan
+        if len(parts) < 5 or "KWH" not in text_upper:
+            return False
 
         # Exclude SCEE-related lines for simple consumers
-        scee_terms = ["COMPENSADO", "EXCEDENTE", "SCEE", "CRÉDITO", "CREDITO"]
-        has_scee = any(term in text.upper() for term in scee_terms)
+        if any(term in text_upper for term in _TERMOS_SCEE):
+            return False
 
-        return has_kwh and has_numeric and len(parts) >= 5 and not has_scee
+        # Must have numeric values
+        return any(self._is_numeric_value(part) for part in parts)
 
-    def _is_bandeira_line(self, text: str, parts: List[str]) -> bool:
-        """Check if line contains bandeira tarifária data."""
-        bandeira_indicators = ["BANDEIRA", "ADICIONAL"]
-        return any(indicator in text.upper() for indicator in bandeira_indicators) and len(parts) >= 4
+    def _is_bandeira_line(self, text_upper: str, parts: List[str]) -> bool:
+        """Check if (upper-cased) line contains bandeira tarifária data."""
+        return any(indicator in text_upper for indicator in _INDICADORES_BANDEIRA) and len(parts) >= 4
 
-    def _is_financial_line(self, text: str, parts: List[str]) -> bool:
-        """Check if line contains financial data (juros, multa, etc)."""
-        financial_indicators = ["JUROS", "MULTA", "ILUMINAÇÃO", "ILUMINACAO"]
-        return any(indicator in text.upper() for indicator in financial_indicators)
+    def _is_financial_line(self, text_upper: str, parts: List[str]) -> bool:
+        """Check if (upper-cased) line contains financial data (juros, multa, etc)."""
+        return any(indicator in text_upper for indicator in _INDICADORES_FINANCEIROS)
 
     def _processar_linha_consumo(self, text: str, parts: List[str]):
         """
@@ -256,13 +275,13 @@ class BConsumidorSimplesExtractor(BaseExtractor):
             self.rs_consumo_geral = tarifa
             self.valor_consumo_geral = valor
 
-    def _processar_linha_bandeira(self, text: str, parts: List[str]):
-        """Process bandeira tarifária line."""
+    def _processar_linha_bandeira(self, text_upper: str, parts: List[str]):
+        """Process (upper-cased) bandeira tarifária line."""
         try:
-            if "AMARELA" in text.upper():
-                self._extrair_bandeira("amarela", text, parts)
-            elif "VERMELHA" in text.upper():
-                self._extrair_bandeira("vermelha", text, parts)
+            if "AMARELA" in text_upper:
+                self._extrair_bandeira("amarela", text_upper, parts)
+            elif "VERMELHA" in text_upper:
+                self._extrair_bandeira("vermelha", text_upper, parts)
         except Exception as e:
             if self.debug:
                 print(f"AVISO: Erro processando bandeira: {e}")
@@ -292,12 +311,12 @@ class BConsumidorSimplesExtractor(BaseExtractor):
             if self.debug:
                 print(f"AVISO: Erro extraindo bandeira: {e}")
 
-    def _processar_linha_financeira(self, text: str, parts: List[str]):
-        """Process financial line (juros, multa, iluminação)."""
-        if "JUROS" in text.upper():
-            self._extrair_juros(text, parts)
-        elif "MULTA" in text.upper():
-            self._extrair_multa(text, parts)
+    def _processar_linha_financeira(self, text_upper: str, parts: List[str]):
+        """Process (upper-cased) financial line (juros, multa, iluminação)."""
+        if "JUROS" in text_upper:
+            self._extrair_juros(text_upper, parts)
+        elif "MULTA" in text_upper:
+            self._extrair_multa(text_upper, parts)
 
     def _extrair_juros(self, text: str, parts: List[str]):
         """Extract juros data."""
@@ -321,6 +340,11 @@ class BConsumidorSimplesExtractor(BaseExtractor):
 
     def _is_numeric_value(self, text: str) -> bool:
         """Check if text represents a numeric value."""
+        # Words ("CONSUMO", "kWh") only parse as float's special values:
+        # answer without raising and catching a ValueError
+        if text.isalpha():
+            return text.lower() in _VALORES_FLOAT_ESPECIAIS
+
         try:
             cleaned = text.replace('.', '').replace(',', '.').replace(' ', '')
             float(cleaned)